@@ -0,0 +1,154 @@
+"""
+Shared definitions for the Multi-VPC CloudFormation template tooling
+YAML loading, CloudFormation tag handling and the expected resource spec used by
+test-template.py, generate-validator.py and yaml-to-json.py
+"""
+
+import hashlib
+import json
+import os
+import sys
+from typing import Any, Dict
+
+import yaml
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
+# CloudFormation short-form intrinsic function tags
+CFN_TAGS = (
+    '!And', '!Base64', '!Cidr', '!Condition', '!Equals', '!FindInMap', '!GetAZs',
+    '!GetAtt', '!If', '!ImportValue', '!Join', '!Not', '!Or', '!Ref', '!Select',
+    '!Split', '!Sub', '!Transform'
+)
+
+# Bump whenever CFNLoader (or CFN_TAGS) changes the shape of loaded templates;
+# test-template.py discards pickle caches written under another version
+LOADER_VERSION = 3
+
+class CFNLoader(YAMLLoader):
+    """Safe loader that expands CloudFormation short-form tags to long-form mappings"""
+
+def _construct_cfn_tag(loader: CFNLoader, node: yaml.Node) -> Dict[str, Any]:
+    """Build the long-form intrinsic function mapping ({"Ref": ...}, {"Fn::Sub": ...}) for a tagged node"""
+    name = node.tag[1:]
+    if isinstance(node, yaml.ScalarNode):
+        value = loader.construct_scalar(node)
+        if name == 'GetAtt':
+            value = value.split('.', 1)
+    elif isinstance(node, yaml.SequenceNode):
+        value = loader.construct_sequence(node, deep=True)
+    else:
+        value = loader.construct_mapping(node, deep=True)
+    key = name if name in ('Ref', 'Condition') else f"Fn::{name}"
+    return {key: value}
+
+for _tag in CFN_TAGS:
+    CFNLoader.add_constructor(_tag, _construct_cfn_tag)
+del _tag
+
+# CloudFormation reads unquoted dates (AWSTemplateFormatVersion: 2010-09-09) as
+# strings; keeping them as str also lets the JSON copy load to the same data
+CFNLoader.add_constructor('tag:yaml.org,2002:timestamp', CFNLoader.construct_yaml_str)
+
+# Output of generate-validator.py; test-template.py's validate_all imports it
+# as its fast path while its fingerprint matches EXPECTED
+GENERATED_VALIDATOR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'validator_generated.py')
+
+def json_sibling_path(file_path: str) -> str:
+    """Return where yaml-to-json.py writes the JSON copy of a YAML template"""
+    return os.path.splitext(file_path)[0] + '.json'
+
+def json_digest_path(json_path: str) -> str:
+    """Return the sidecar file recording which YAML content a JSON copy was built from"""
+    return json_path + '.sha256'
+
+def source_digest(data: bytes) -> str:
+    """Hash of the raw YAML bytes, compared against the JSON copy's sidecar"""
+    return hashlib.sha256(data).hexdigest()
+
+# Expected CIDRs are interned, as are the loaded ones in test-template.py and
+# the constants in validator_generated.py, so matching values compare by identity
+EXPECTED_VPC_CIDRS = {
+    'VPC1': sys.intern('10.0.0.0/22'),
+    'VPC2': sys.intern('10.0.4.0/22')
+}
+
+# Expected subnets for each VPC as (logical ID, CIDR) pairs
+EXPECTED_SUBNETS = {
+    'VPC1': (
+        ('VPC1PublicSubnet1', sys.intern('10.0.0.0/26')),
+        ('VPC1PublicSubnet2', sys.intern('10.0.0.64/26')),
+        ('VPC1PrivateSubnet1', sys.intern('10.0.1.0/26')),
+        ('VPC1PrivateSubnet2', sys.intern('10.0.1.64/26')),
+        ('VPC1TGWSubnet1', sys.intern('10.0.2.0/26')),
+        ('VPC1TGWSubnet2', sys.intern('10.0.2.64/26'))
+    ),
+    'VPC2': (
+        ('VPC2PublicSubnet1', sys.intern('10.0.4.0/26')),
+        ('VPC2PublicSubnet2', sys.intern('10.0.4.64/26')),
+        ('VPC2PrivateSubnet1', sys.intern('10.0.5.0/26')),
+        ('VPC2PrivateSubnet2', sys.intern('10.0.5.64/26')),
+        ('VPC2TGWSubnet1', sys.intern('10.0.6.0/26')),
+        ('VPC2TGWSubnet2', sys.intern('10.0.6.64/26'))
+    )
+}
+
+# Required logical IDs / sections, checked with a single set difference each
+REQUIRED_SECTIONS = frozenset({'AWSTemplateFormatVersion', 'Description', 'Parameters', 'Resources', 'Outputs'})
+REQUIRED_ATTACHMENTS = frozenset({'TGWAttachmentVPC1', 'TGWAttachmentVPC2'})
+REQUIRED_ROUTES = frozenset({'VPC1ToVPC2Route1', 'VPC1ToVPC2Route2', 'VPC2ToVPC1Route1', 'VPC2ToVPC1Route2'})
+REQUIRED_ENDPOINTS = frozenset({
+    'VPC1SSMEndpoint', 'VPC1SSMMessagesEndpoint', 'VPC1EC2MessagesEndpoint',
+    'VPC2SSMEndpoint', 'VPC2SSMMessagesEndpoint', 'VPC2EC2MessagesEndpoint'
+})
+REQUIRED_SECURITY_GROUPS = frozenset({
+    'VPC1EndpointSecurityGroup', 'VPC2EndpointSecurityGroup',
+    'VPC1EC2SecurityGroup', 'VPC2EC2SecurityGroup'
+})
+REQUIRED_INSTANCES = frozenset({'VPC1EC2Instance', 'VPC2EC2Instance'})
+REQUIRED_IGWS = frozenset({'VPC1InternetGateway', 'VPC2InternetGateway'})
+REQUIRED_NATS = frozenset({'VPC1NatGateway1', 'VPC1NatGateway2', 'VPC2NatGateway1', 'VPC2NatGateway2'})
+REQUIRED_ROUTE_TABLES = frozenset({
+    'VPC1PublicRouteTable', 'VPC1PrivateRouteTable1', 'VPC1PrivateRouteTable2',
+    'VPC2PublicRouteTable', 'VPC2PrivateRouteTable1', 'VPC2PrivateRouteTable2'
+})
+REQUIRED_OUTPUTS = frozenset({
+    'VPC1Id', 'VPC2Id', 'TransitGatewayId',
+    'VPC1EC2InstanceId', 'VPC2EC2InstanceId',
+    'VPC1EC2PrivateIP', 'VPC2EC2PrivateIP'
+})
+
+# Full resource expectations (Type plus any pinned Properties) checked by
+# test-template.py's validate_all and the generated validator
+EXPECTED: Dict[str, Dict[str, Any]] = {
+    'VPC1': {'Type': 'AWS::EC2::VPC', 'Properties': {'CidrBlock': EXPECTED_VPC_CIDRS['VPC1']}},
+    'VPC2': {'Type': 'AWS::EC2::VPC', 'Properties': {'CidrBlock': EXPECTED_VPC_CIDRS['VPC2']}},
+    'TransitGateway': {'Type': 'AWS::EC2::TransitGateway'},
+    'EC2SSMRole': {'Type': 'AWS::IAM::Role'},
+    'EC2InstanceProfile': {'Type': 'AWS::IAM::InstanceProfile'}
+}
+EXPECTED.update(
+    (name, {'Type': 'AWS::EC2::Subnet', 'Properties': {'CidrBlock': cidr}})
+    for subnets in EXPECTED_SUBNETS.values()
+    for name, cidr in subnets
+)
+for _type, _names in (
+    ('AWS::EC2::TransitGatewayAttachment', REQUIRED_ATTACHMENTS),
+    ('AWS::EC2::Route', REQUIRED_ROUTES),
+    ('AWS::EC2::VPCEndpoint', REQUIRED_ENDPOINTS),
+    ('AWS::EC2::SecurityGroup', REQUIRED_SECURITY_GROUPS),
+    ('AWS::EC2::Instance', REQUIRED_INSTANCES),
+    ('AWS::EC2::InternetGateway', REQUIRED_IGWS),
+    ('AWS::EC2::NatGateway', REQUIRED_NATS),
+    ('AWS::EC2::RouteTable', REQUIRED_ROUTE_TABLES)
+):
+    EXPECTED.update((name, {'Type': _type}) for name in sorted(_names))
+del _type, _names
+
+def expected_spec_fingerprint() -> str:
+    """Stable hash of EXPECTED, used to tell whether the generated validator is current"""
+    return hashlib.sha1(json.dumps(EXPECTED, sort_keys=True).encode('utf-8')).hexdigest()
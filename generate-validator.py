@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Generate validator_generated.py from the expectations in cfn_template.py
+The output is a single straight-line function with early returns, so the
+common all-valid case costs one dict lookup and compare per expectation
+"""
+
+import os
+import sys
+from typing import Any, Dict, List
+
+from cfn_template import EXPECTED, GENERATED_VALIDATOR_PATH, expected_spec_fingerprint
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def generate_source(expected: Dict[str, Dict[str, Any]], fingerprint: str) -> str:
+    """Render the validator module source for the given resource spec"""
+    # Expected property strings become module-level interned constants; CPython
+    # doesn't intern non-identifier literals such as CIDRs, and the loaded values
+    # are interned by test-template.py, so matches compare by identity
+    constants: Dict[str, str] = {}
+    for name in sorted(expected):
+        for _, value in sorted(expected[name].get('Properties', {}).items()):
+            if isinstance(value, str) and value not in constants:
+                constants[value] = f'_S{len(constants)}'
+
+    def literal(value: Any) -> str:
+        return constants.get(value, repr(value)) if isinstance(value, str) else repr(value)
+
+    lines: List[str] = [
+        '# Generated by generate-validator.py from EXPECTED in cfn_template.py. Do not edit.',
+        '',
+        'import sys',
+        '',
+        f'SPEC_FINGERPRINT = {fingerprint!r}',
+        '',
+    ]
+    lines.extend(f'{constant} = sys.intern({value!r})' for value, constant in constants.items())
+    lines += [
+        '',
+        'def validate(t):',
+        '    """Return True if every expected resource has the expected Type and Properties"""',
+        "    r = t.get('Resources') if isinstance(t, dict) else None",
+        '    if not isinstance(r, dict):',
+        '        return False',
+    ]
+    for name in sorted(expected):
+        spec = expected[name]
+        lines.append(f'    x = r.get({name!r})')
+        lines.append(f"    if not isinstance(x, dict) or x.get('Type') != {spec['Type']!r}:")
+        lines.append('        return False')
+        properties = spec.get('Properties', {})
+        if properties:
+            lines.append("    p = x.get('Properties')")
+            checks = ' or '.join(f'p.get({key!r}) != {literal(value)}' for key, value in sorted(properties.items()))
+            lines.append(f'    if not isinstance(p, dict) or {checks}:')
+            lines.append('        return False')
+    lines.append('    return True')
+    return '\n'.join(lines) + '\n'
+
+def main() -> int:
+    """Write validator_generated.py next to the template tests"""
+    source = generate_source(EXPECTED, expected_spec_fingerprint())
+    with open(GENERATED_VALIDATOR_PATH, 'w') as file:
+        file.write(source)
+    print(f"✅ Wrote {os.path.relpath(GENERATED_VALIDATOR_PATH, HERE)} ({len(EXPECTED)} resources)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
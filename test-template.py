@@ -7,173 +7,263 @@ This script validates the template structure and ensures all required resources
 import yaml
 import json
 import sys
+import os
+import hashlib
+import pickle
 import ipaddress
-from typing import Dict, Any, List
+import collections
+import functools
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+from cfn_template import (
+    CFNLoader, YAMLLoader, EXPECTED, LOADER_VERSION,
+    REQUIRED_OUTPUTS, REQUIRED_SECTIONS, expected_spec_fingerprint,
+    json_digest_path, json_sibling_path, source_digest
+)
+
+# NumPy is optional; it only speeds up overlap checks on very large templates
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# orjson is optional; the stdlib parser is used for the JSON template copy otherwise
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Subnet count from which overlap detection switches to NumPy (when available)
+NUMPY_MIN_RANGES = 256
+
+# Top-level keys a discovery pass needs before deciding to load the full template
+HEADER_KEYS = frozenset({'AWSTemplateFormatVersion', 'Description', 'Parameters'})
+
+# Stand-in load_template_header returns for mapping and sequence values, so a
+# present section is distinguishable from an explicit null
+NESTED_VALUE = object()
+
+# Resources grouped as {Type: {LogicalId: resource}}
+ResourceIndex = Dict[str, Dict[str, Dict[str, Any]]]
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'cfn_tests')
+
+def _cache_path(file_path: str) -> str:
+    """Return the pickle cache location for a template path"""
+    key = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.pkl")
+
+def _read_cache(cache_path: str, stat: os.stat_result) -> Any:
+    """Return the cached template if it matches the loader version and the file's mtime and size"""
+    try:
+        with open(cache_path, 'rb') as file:
+            version, mtime_ns, size, template = pickle.load(file)
+    except Exception:
+        return None
+    if version != LOADER_VERSION or mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+        return None
+    return template
+
+def _write_cache(cache_path: str, stat: os.stat_result, template: Dict[str, Any]) -> None:
+    """Store the parsed template; a failed write only costs a re-parse next time"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as file:
+            pickle.dump((LOADER_VERSION, stat.st_mtime_ns, stat.st_size, template), file, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+def _read_json_sibling(file_path: str, data: bytes) -> Any:
+    """Load the JSON copy of the template if its sidecar digest matches the YAML bytes"""
+    json_path = json_sibling_path(file_path)
+    if json_path == file_path:
+        return None
+    try:
+        with open(json_digest_path(json_path)) as file:
+            if file.read().strip() != source_digest(data):
+                return None
+        with open(json_path, 'rb') as file:
+            return _json_loads(file.read())
+    except (OSError, ValueError):
+        return None
 
 def load_template(file_path: str) -> Dict[str, Any]:
-    """Load the CloudFormation template from YAML file"""
+    """Load the CloudFormation template, reusing a cached parse or current JSON copy when available
+
+    Intrinsic functions come back in long form ({"Ref": ...}, {"Fn::Sub": ...})
+    whether the data is read from the YAML or from its JSON copy.
+    """
     try:
-        with open(file_path, 'r') as file:
-            return yaml.safe_load(file)
+        stat = os.stat(file_path)
+        cache_path = _cache_path(file_path)
+        template = _read_cache(cache_path, stat)
+        if template is not None:
+            return template
+        with open(file_path, 'rb') as file:
+            data = file.read()
+        template = _read_json_sibling(file_path, data)
+        if template is None:
+            template = yaml.load(data, Loader=CFNLoader)
+        _write_cache(cache_path, stat, template)
+        return template
     except Exception as e:
         print(f"Error loading template: {e}")
         sys.exit(1)
 
-def test_template_structure(template: Dict[str, Any]) -> bool:
-    """Test basic template structure"""
-    print("Testing template structure...")
-    
-    required_sections = ['AWSTemplateFormatVersion', 'Description', 'Parameters', 'Resources', 'Outputs']
-    
-    for section in required_sections:
-        if section not in template:
-            print(f"❌ Missing required section: {section}")
-            return False
-    
-    print("✅ Template structure is valid")
-    return True
+def load_template_header(file_path: str, keys: frozenset = HEADER_KEYS) -> Dict[str, Any]:
+    """Scan top-level keys from the YAML event stream, stopping once all of `keys` are seen.
 
-def test_vpc_configuration(template: Dict[str, Any]) -> bool:
-    """Test VPC configuration"""
-    print("Testing VPC configuration...")
-    
-    resources = template.get('Resources', {})
-    
-    # Check VPC1
-    if 'VPC1' not in resources:
-        print("❌ VPC1 not found")
-        return False
-    
-    vpc1 = resources['VPC1']
-    if vpc1.get('Properties', {}).get('CidrBlock') != '10.0.0.0/22':
-        print("❌ VPC1 CIDR block is incorrect")
-        return False
-    
-    # Check VPC2
-    if 'VPC2' not in resources:
-        print("❌ VPC2 not found")
-        return False
-    
-    vpc2 = resources['VPC2']
-    if vpc2.get('Properties', {}).get('CidrBlock') != '10.0.4.0/22':
-        print("❌ VPC2 CIDR block is incorrect")
-        return False
-    
-    print("✅ VPC configuration is correct")
-    return True
-
-def test_subnet_configuration(template: Dict[str, Any]) -> bool:
-    """Test subnet configuration"""
-    print("Testing subnet configuration...")
-    
-    resources = template.get('Resources', {})
-    
-    # Expected subnets for each VPC
-    expected_subnets = {
-        'VPC1': {
-            'VPC1PublicSubnet1': '10.0.0.0/26',
-            'VPC1PublicSubnet2': '10.0.0.64/26',
-            'VPC1PrivateSubnet1': '10.0.1.0/26',
-            'VPC1PrivateSubnet2': '10.0.1.64/26',
-            'VPC1TGWSubnet1': '10.0.2.0/26',
-            'VPC1TGWSubnet2': '10.0.2.64/26'
-        },
-        'VPC2': {
-            'VPC2PublicSubnet1': '10.0.4.0/26',
-            'VPC2PublicSubnet2': '10.0.4.64/26',
-            'VPC2PrivateSubnet1': '10.0.5.0/26',
-            'VPC2PrivateSubnet2': '10.0.5.64/26',
-            'VPC2TGWSubnet1': '10.0.6.0/26',
-            'VPC2TGWSubnet2': '10.0.6.64/26'
-        }
-    }
-    
-    for vpc, subnets in expected_subnets.items():
-        for subnet_name, expected_cidr in subnets.items():
-            if subnet_name not in resources:
-                print(f"❌ Subnet {subnet_name} not found")
-                return False
+    Scalar values are returned as their raw text and aliases as None; mappings
+    and sequences are skipped without being constructed and reported as
+    NESTED_VALUE. If any of `keys` is missing the whole stream is scanned, so
+    the result then holds every top-level key. Merge keys (<<) are not expanded,
+    so use load_template when the answer must match a full load.
+    """
+    header = {}
+    remaining = set(keys)
+    depth = 0
+    key = None
+    expecting_key = True
+    with open(file_path, 'rb') as file:
+        for event in yaml.parse(file, Loader=YAMLLoader):
+            if isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+                continue
             
-            actual_cidr = resources[subnet_name].get('Properties', {}).get('CidrBlock')
-            if actual_cidr != expected_cidr:
-                print(f"❌ Subnet {subnet_name} has incorrect CIDR: {actual_cidr} (expected {expected_cidr})")
-                return False
-    
-    print("✅ Subnet configuration is correct")
-    return True
+            is_collection = isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent))
+            if depth == 1 and (is_collection or isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent))):
+                if is_collection:
+                    value = NESTED_VALUE
+                else:
+                    value = event.value if isinstance(event, yaml.ScalarEvent) else None
+                if expecting_key:
+                    key = value
+                else:
+                    header[key] = value
+                    remaining.discard(key)
+                    if not remaining:
+                        break
+                expecting_key = not expecting_key
+            
+            if is_collection:
+                depth += 1
+    return header
 
-def test_transit_gateway(template: Dict[str, Any]) -> bool:
-    """Test Transit Gateway configuration"""
-    print("Testing Transit Gateway configuration...")
-    
-    resources = template.get('Resources', {})
-    
-    # Check Transit Gateway
-    if 'TransitGateway' not in resources:
-        print("❌ Transit Gateway not found")
+# Resource types whose CidrBlock is compared against expected constants
+_CIDR_RESOURCE_TYPES = frozenset({'AWS::EC2::VPC', 'AWS::EC2::Subnet'})
+
+def _format_names(names) -> str:
+    """Render a set of names in a stable order for diagnostics"""
+    return ', '.join(sorted(names))
+
+def build_resource_index(template: Dict[str, Any]) -> ResourceIndex:
+    """Group resources by Type in a single pass so tests don't rescan Resources
+
+    VPC and subnet CidrBlock strings are interned along the way to match the
+    interned expected values.
+    """
+    by_type = collections.defaultdict(dict)
+    resources = template.get('Resources') if isinstance(template, dict) else None
+    if not isinstance(resources, dict):
+        return {}
+    for name, resource in resources.items():
+        # Malformed entries are left out; the tests report them as missing
+        if not isinstance(resource, dict):
+            continue
+        resource_type = resource.get('Type')
+        if not isinstance(resource_type, str):
+            resource_type = ''
+        by_type[resource_type][name] = resource
+        if resource_type in _CIDR_RESOURCE_TYPES:
+            properties = resource.get('Properties')
+            if isinstance(properties, dict) and isinstance(properties.get('CidrBlock'), str):
+                properties['CidrBlock'] = sys.intern(properties['CidrBlock'])
+    return dict(by_type)
+
+@functools.lru_cache(maxsize=None)
+def _generated_validator():
+    """Return validate() from validator_generated.py if present and built from the current spec"""
+    try:
+        import validator_generated
+    except ImportError:
+        return None
+    if getattr(validator_generated, 'SPEC_FINGERPRINT', None) != expected_spec_fingerprint():
+        return None
+    return validator_generated.validate
+
+def validate_all(template: Dict[str, Any]) -> List[str]:
+    """Check every expected resource's Type and Properties in one pass; returns the problems found"""
+    # The generated straight-line validator answers the common all-good case;
+    # fall through to the walk below to collect diagnostics when it fails
+    validator = _generated_validator()
+    if validator is not None and validator(template):
+        return []
+    
+    resources = template.get('Resources') if isinstance(template, dict) else None
+    if not isinstance(resources, dict):
+        resources = {}
+    errors = []
+    
+    for name, spec in EXPECTED.items():
+        resource = resources.get(name)
+        if not isinstance(resource, dict):
+            errors.append(f"{name} not found")
+            continue
+        
+        if resource.get('Type') != spec['Type']:
+            errors.append(f"{name} is not of type {spec['Type']}")
+            continue
+        
+        properties = resource.get('Properties')
+        if not isinstance(properties, dict):
+            properties = {}
+        for key, expected in spec.get('Properties', {}).items():
+            actual = properties.get(key)
+            if actual != expected:
+                errors.append(f"{name} has incorrect {key}: {actual} (expected {expected})")
+    
+    return errors
+
+def test_expected_resources(template: Dict[str, Any], index: ResourceIndex) -> bool:
+    """Test that every expected resource exists with its Type and pinned Properties"""
+    print("Testing expected resources...")
+    
+    errors = validate_all(template)
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
         return False
     
-    # Check TGW attachments
-    required_attachments = ['TGWAttachmentVPC1', 'TGWAttachmentVPC2']
-    for attachment in required_attachments:
-        if attachment not in resources:
-            print(f"❌ Transit Gateway attachment {attachment} not found")
-            return False
-    
-    # Check inter-VPC routes
-    required_routes = ['VPC1ToVPC2Route1', 'VPC1ToVPC2Route2', 'VPC2ToVPC1Route1', 'VPC2ToVPC1Route2']
-    for route in required_routes:
-        if route not in resources:
-            print(f"❌ Inter-VPC route {route} not found")
-            return False
-    
-    print("✅ Transit Gateway configuration is correct")
+    print("✅ All expected resources are present and correctly configured")
     return True
 
-def test_vpc_endpoints(template: Dict[str, Any]) -> bool:
-    """Test VPC endpoints for SSM"""
-    print("Testing VPC endpoints...")
-    
-    resources = template.get('Resources', {})
-    
-    # Required endpoints for each VPC
-    required_endpoints = [
-        'VPC1SSMEndpoint', 'VPC1SSMMessagesEndpoint', 'VPC1EC2MessagesEndpoint',
-        'VPC2SSMEndpoint', 'VPC2SSMMessagesEndpoint', 'VPC2EC2MessagesEndpoint'
-    ]
+def test_template_structure(template: Dict[str, Any], index: ResourceIndex) -> bool:
+    """Test basic template structure"""
+    print("Testing template structure...")
     
-    for endpoint in required_endpoints:
-        if endpoint not in resources:
-            print(f"❌ VPC endpoint {endpoint} not found")
-            return False
-        
-        endpoint_resource = resources[endpoint]
-        if endpoint_resource.get('Type') != 'AWS::EC2::VPCEndpoint':
-            print(f"❌ {endpoint} is not of type AWS::EC2::VPCEndpoint")
-            return False
+    # A non-mapping document (a list, or an empty file) has none of the sections
+    missing = REQUIRED_SECTIONS - template.keys() if isinstance(template, dict) else REQUIRED_SECTIONS
+    if missing:
+        print(f"❌ Missing required section(s): {_format_names(missing)}")
+        return False
     
-    print("✅ VPC endpoints configuration is correct")
+    print("✅ Template structure is valid")
     return True
 
-def test_security_groups(template: Dict[str, Any]) -> bool:
+def test_security_groups(template: Dict[str, Any], index: ResourceIndex) -> bool:
     """Test security group configuration"""
     print("Testing security groups...")
     
-    resources = template.get('Resources', {})
-    
-    # Required security groups
-    required_sgs = [
-        'VPC1EndpointSecurityGroup', 'VPC2EndpointSecurityGroup',
-        'VPC1EC2SecurityGroup', 'VPC2EC2SecurityGroup'
-    ]
-    
-    for sg in required_sgs:
-        if sg not in resources:
-            print(f"❌ Security group {sg} not found")
-            return False
+    security_groups = index.get('AWS::EC2::SecurityGroup', {})
     
-    # Check EC2 security groups have ICMP rules
-    vpc1_ec2_sg = resources.get('VPC1EC2SecurityGroup', {})
+    # Presence and Type are covered by test_expected_resources; check the
+    # EC2 security groups have ICMP rules
+    vpc1_ec2_sg = security_groups.get('VPC1EC2SecurityGroup', {})
     vpc1_ingress = vpc1_ec2_sg.get('Properties', {}).get('SecurityGroupIngress', [])
     
     has_icmp = any(rule.get('IpProtocol') == 'icmp' for rule in vpc1_ingress)
@@ -181,7 +271,7 @@ def test_security_groups(template: Dict[str, Any]) -> bool:
         print("❌ VPC1 EC2 security group missing ICMP rule")
         return False
     
-    vpc2_ec2_sg = resources.get('VPC2EC2SecurityGroup', {})
+    vpc2_ec2_sg = security_groups.get('VPC2EC2SecurityGroup', {})
     vpc2_ingress = vpc2_ec2_sg.get('Properties', {}).get('SecurityGroupIngress', [])
     
     has_icmp = any(rule.get('IpProtocol') == 'icmp' for rule in vpc2_ingress)
@@ -192,157 +282,168 @@ def test_security_groups(template: Dict[str, Any]) -> bool:
     print("✅ Security groups configuration is correct")
     return True
 
-def test_ec2_instances(template: Dict[str, Any]) -> bool:
-    """Test EC2 instance configuration"""
-    print("Testing EC2 instances...")
-    
-    resources = template.get('Resources', {})
-    
-    # Check EC2 instances
-    required_instances = ['VPC1EC2Instance', 'VPC2EC2Instance']
-    for instance in required_instances:
-        if instance not in resources:
-            print(f"❌ EC2 instance {instance} not found")
-            return False
-        
-        instance_resource = resources[instance]
-        if instance_resource.get('Type') != 'AWS::EC2::Instance':
-            print(f"❌ {instance} is not of type AWS::EC2::Instance")
-            return False
-    
-    # Check IAM role
-    if 'EC2SSMRole' not in resources:
-        print("❌ EC2 SSM IAM role not found")
-        return False
-    
-    if 'EC2InstanceProfile' not in resources:
-        print("❌ EC2 instance profile not found")
-        return False
-    
-    print("✅ EC2 instances configuration is correct")
-    return True
-
-def test_networking_components(template: Dict[str, Any]) -> bool:
-    """Test networking components"""
-    print("Testing networking components...")
-    
-    resources = template.get('Resources', {})
-    
-    # Check Internet Gateways
-    required_igws = ['VPC1InternetGateway', 'VPC2InternetGateway']
-    for igw in required_igws:
-        if igw not in resources:
-            print(f"❌ Internet Gateway {igw} not found")
-            return False
-    
-    # Check NAT Gateways
-    required_nats = ['VPC1NatGateway1', 'VPC1NatGateway2', 'VPC2NatGateway1', 'VPC2NatGateway2']
-    for nat in required_nats:
-        if nat not in resources:
-            print(f"❌ NAT Gateway {nat} not found")
-            return False
-    
-    # Check Route Tables
-    required_rts = [
-        'VPC1PublicRouteTable', 'VPC1PrivateRouteTable1', 'VPC1PrivateRouteTable2',
-        'VPC2PublicRouteTable', 'VPC2PrivateRouteTable1', 'VPC2PrivateRouteTable2'
-    ]
-    for rt in required_rts:
-        if rt not in resources:
-            print(f"❌ Route Table {rt} not found")
-            return False
-    
-    print("✅ Networking components configuration is correct")
-    return True
-
-def test_outputs(template: Dict[str, Any]) -> bool:
+def test_outputs(template: Dict[str, Any], index: ResourceIndex) -> bool:
     """Test template outputs"""
     print("Testing template outputs...")
     
-    outputs = template.get('Outputs', {})
-    
-    required_outputs = [
-        'VPC1Id', 'VPC2Id', 'TransitGatewayId',
-        'VPC1EC2InstanceId', 'VPC2EC2InstanceId',
-        'VPC1EC2PrivateIP', 'VPC2EC2PrivateIP'
-    ]
-    
-    for output in required_outputs:
-        if output not in outputs:
-            print(f"❌ Output {output} not found")
-            return False
+    outputs = template.get('Outputs') if isinstance(template, dict) else None
+    missing = REQUIRED_OUTPUTS - outputs.keys() if isinstance(outputs, dict) else REQUIRED_OUTPUTS
+    if missing:
+        print(f"❌ Output(s) not found: {_format_names(missing)}")
+        return False
     
     print("✅ Template outputs are correct")
     return True
 
-def validate_cidr_ranges(template: Dict[str, Any]) -> bool:
+@functools.lru_cache(maxsize=None)
+def _cidr_range(cidr: str) -> Tuple[int, int]:
+    """Parse a CIDR into its (first, last) address integers, memoized across calls"""
+    network = ipaddress.IPv4Network(cidr)
+    return int(network.network_address), int(network.broadcast_address)
+
+def _find_overlap(ranges: List[Tuple[int, int, str, str]]) -> Optional[Tuple[tuple, tuple]]:
+    """Return a pair of overlapping (first, last, name, cidr) ranges, or None.
+
+    Ranges are ordered by start address; any range that begins at or before
+    its predecessor's end overlaps it. Large inputs do the comparison with
+    NumPy when it is installed.
+    """
+    if np is not None and len(ranges) >= NUMPY_MIN_RANGES:
+        starts = np.fromiter((r[0] for r in ranges), dtype=np.uint32, count=len(ranges))
+        ends = np.fromiter((r[1] for r in ranges), dtype=np.uint32, count=len(ranges))
+        order = starts.argsort(kind='stable')
+        bad = np.nonzero(ends[order][:-1] >= starts[order][1:])[0]
+        if len(bad) == 0:
+            return None
+        i = int(bad[0])
+        return ranges[order[i]], ranges[order[i + 1]]
+    
+    ordered = sorted(ranges)
+    for prev, cur in zip(ordered, ordered[1:]):
+        if cur[0] <= prev[1]:
+            return prev, cur
+    return None
+
+def validate_cidr_ranges(template: Dict[str, Any], index: ResourceIndex) -> bool:
     """Validate CIDR ranges don't overlap and are properly sized"""
     print("Validating CIDR ranges...")
     
-    resources = template.get('Resources', {})
-    
-    # Get all subnet CIDRs
-    subnet_cidrs = []
-    for resource_name, resource in resources.items():
-        if resource.get('Type') == 'AWS::EC2::Subnet':
-            cidr = resource.get('Properties', {}).get('CidrBlock')
-            if cidr:
-                try:
-                    network = ipaddress.IPv4Network(cidr)
-                    subnet_cidrs.append((resource_name, network))
-                except ValueError as e:
-                    print(f"❌ Invalid CIDR in {resource_name}: {cidr}")
-                    return False
+    # Get all subnet CIDRs as (first, last, name, cidr)
+    ranges = []
+    for resource_name, resource in index.get('AWS::EC2::Subnet', {}).items():
+        cidr = resource.get('Properties', {}).get('CidrBlock')
+        if cidr:
+            try:
+                first, last = _cidr_range(cidr)
+                ranges.append((first, last, resource_name, cidr))
+            except (ValueError, TypeError) as e:
+                print(f"❌ Invalid CIDR in {resource_name}: {cidr}")
+                return False
     
     # Check for overlaps
-    for i, (name1, net1) in enumerate(subnet_cidrs):
-        for j, (name2, net2) in enumerate(subnet_cidrs[i+1:], i+1):
-            if net1.overlaps(net2):
-                print(f"❌ CIDR overlap between {name1} ({net1}) and {name2} ({net2})")
-                return False
+    overlap = _find_overlap(ranges)
+    if overlap is not None:
+        prev, cur = overlap
+        print(f"❌ CIDR overlap between {prev[2]} ({prev[3]}) and {cur[2]} ({cur[3]})")
+        return False
     
     print("✅ CIDR ranges are valid and non-overlapping")
     return True
 
-def run_all_tests(template_path: str) -> bool:
-    """Run all tests"""
-    print("=== CloudFormation Template Validation ===")
-    print(f"Template: {template_path}")
-    print("")
+_captured = threading.local()
+
+class _ThreadRoutedStdout:
+    """sys.stdout stand-in that writes to the calling thread's capture buffer, if any"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text: str) -> int:
+        buffer = getattr(_captured, 'buffer', None)
+        return (buffer if buffer is not None else self._stream).write(text)
+    
+    def flush(self) -> None:
+        if getattr(_captured, 'buffer', None) is None:
+            self._stream.flush()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+def _run_captured(test, template: Dict[str, Any], index: ResourceIndex) -> Tuple[bool, str]:
+    """Run one test with its prints captured; returns (passed, output)"""
+    _captured.buffer = io.StringIO()
+    try:
+        try:
+            passed = test(template, index)
+        except Exception as e:
+            print(f"❌ Test {test.__name__} failed with error: {e}")
+            passed = False
+        return passed, _captured.buffer.getvalue()
+    finally:
+        _captured.buffer = None
+
+def run_all_tests(template_path: str, verbose: bool = True, fail_fast: bool = True) -> bool:
+    """Run all tests; with verbose=False only failing tests and the summary are shown.
+
+    With fail_fast the tests run one at a time, cheapest first, and stop at the
+    first failure; otherwise they all run concurrently.
+    """
+    if verbose:
+        print("=== CloudFormation Template Validation ===")
+        print(f"Template: {template_path}")
+        print("")
     
     template = load_template(template_path)
+    index = build_resource_index(template)
     
+    # Cheap, most frequently failing checks first; CIDR parsing last
     tests = [
         test_template_structure,
-        test_vpc_configuration,
-        test_subnet_configuration,
-        test_transit_gateway,
-        test_vpc_endpoints,
-        test_security_groups,
-        test_ec2_instances,
-        test_networking_components,
+        test_expected_resources,
         test_outputs,
+        test_security_groups,
         validate_cidr_ranges
     ]
     
+    # Tests only read the template, so without fail_fast run them concurrently;
+    # either way each one's captured output is replayed in the order above
+    original_stdout = sys.stdout
+    sys.stdout = _ThreadRoutedStdout(original_stdout)
+    try:
+        if fail_fast:
+            results = []
+            for test in tests:
+                results.append(_run_captured(test, template, index))
+                if not results[-1][0]:
+                    break
+        else:
+            with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+                results = list(executor.map(lambda test: _run_captured(test, template, index), tests))
+    finally:
+        sys.stdout = original_stdout
+    
+    # Assemble the whole report and write it once
+    report = []
     all_passed = True
-    for test in tests:
-        try:
-            if not test(template):
-                all_passed = False
-        except Exception as e:
-            print(f"❌ Test {test.__name__} failed with error: {e}")
+    for passed, output in results:
+        if not passed:
             all_passed = False
-        print("")
+        if verbose or not passed:
+            report.append(output)
+            report.append("\n")
     
     if all_passed:
-        print("🎉 All tests passed! Template is valid.")
-        return True
+        report.append("🎉 All tests passed! Template is valid.\n")
     else:
-        print("❌ Some tests failed. Please review the template.")
-        return False
+        report.append("❌ Some tests failed. Please review the template.\n")
+    sys.stdout.write("".join(report))
+    return all_passed
 
 if __name__ == "__main__":
     template_path = "vpc-infrastructure.yaml"
-    success = run_all_tests(template_path)
+    success = run_all_tests(
+        template_path,
+        verbose='--quiet' not in sys.argv[1:],
+        fail_fast='--keep-going' not in sys.argv[1:]
+    )
     sys.exit(0 if success else 1)
\ No newline at end of file
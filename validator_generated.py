@@ -0,0 +1,210 @@
+# Generated by generate-validator.py from EXPECTED in cfn_template.py. Do not edit.
+
+import sys
+
+SPEC_FINGERPRINT = 'e8f4284988b97a056a85ef0e7dee4d1cb39253b9'
+
+_S0 = sys.intern('10.0.0.0/22')
+_S1 = sys.intern('10.0.1.0/26')
+_S2 = sys.intern('10.0.1.64/26')
+_S3 = sys.intern('10.0.0.0/26')
+_S4 = sys.intern('10.0.0.64/26')
+_S5 = sys.intern('10.0.2.0/26')
+_S6 = sys.intern('10.0.2.64/26')
+_S7 = sys.intern('10.0.4.0/22')
+_S8 = sys.intern('10.0.5.0/26')
+_S9 = sys.intern('10.0.5.64/26')
+_S10 = sys.intern('10.0.4.0/26')
+_S11 = sys.intern('10.0.4.64/26')
+_S12 = sys.intern('10.0.6.0/26')
+_S13 = sys.intern('10.0.6.64/26')
+
+def validate(t):
+    """Return True if every expected resource has the expected Type and Properties"""
+    r = t.get('Resources') if isinstance(t, dict) else None
+    if not isinstance(r, dict):
+        return False
+    x = r.get('EC2InstanceProfile')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::IAM::InstanceProfile':
+        return False
+    x = r.get('EC2SSMRole')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::IAM::Role':
+        return False
+    x = r.get('TGWAttachmentVPC1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::TransitGatewayAttachment':
+        return False
+    x = r.get('TGWAttachmentVPC2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::TransitGatewayAttachment':
+        return False
+    x = r.get('TransitGateway')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::TransitGateway':
+        return False
+    x = r.get('VPC1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::VPC':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S0:
+        return False
+    x = r.get('VPC1EC2Instance')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Instance':
+        return False
+    x = r.get('VPC1EC2MessagesEndpoint')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::VPCEndpoint':
+        return False
+    x = r.get('VPC1EC2SecurityGroup')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::SecurityGroup':
+        return False
+    x = r.get('VPC1EndpointSecurityGroup')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::SecurityGroup':
+        return False
+    x = r.get('VPC1InternetGateway')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::InternetGateway':
+        return False
+    x = r.get('VPC1NatGateway1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::NatGateway':
+        return False
+    x = r.get('VPC1NatGateway2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::NatGateway':
+        return False
+    x = r.get('VPC1PrivateRouteTable1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::RouteTable':
+        return False
+    x = r.get('VPC1PrivateRouteTable2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::RouteTable':
+        return False
+    x = r.get('VPC1PrivateSubnet1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Subnet':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S1:
+        return False
+    x = r.get('VPC1PrivateSubnet2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Subnet':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S2:
+        return False
+    x = r.get('VPC1PublicRouteTable')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::RouteTable':
+        return False
+    x = r.get('VPC1PublicSubnet1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Subnet':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S3:
+        return False
+    x = r.get('VPC1PublicSubnet2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Subnet':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S4:
+        return False
+    x = r.get('VPC1SSMEndpoint')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::VPCEndpoint':
+        return False
+    x = r.get('VPC1SSMMessagesEndpoint')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::VPCEndpoint':
+        return False
+    x = r.get('VPC1TGWSubnet1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Subnet':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S5:
+        return False
+    x = r.get('VPC1TGWSubnet2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Subnet':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S6:
+        return False
+    x = r.get('VPC1ToVPC2Route1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Route':
+        return False
+    x = r.get('VPC1ToVPC2Route2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Route':
+        return False
+    x = r.get('VPC2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::VPC':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S7:
+        return False
+    x = r.get('VPC2EC2Instance')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Instance':
+        return False
+    x = r.get('VPC2EC2MessagesEndpoint')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::VPCEndpoint':
+        return False
+    x = r.get('VPC2EC2SecurityGroup')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::SecurityGroup':
+        return False
+    x = r.get('VPC2EndpointSecurityGroup')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::SecurityGroup':
+        return False
+    x = r.get('VPC2InternetGateway')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::InternetGateway':
+        return False
+    x = r.get('VPC2NatGateway1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::NatGateway':
+        return False
+    x = r.get('VPC2NatGateway2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::NatGateway':
+        return False
+    x = r.get('VPC2PrivateRouteTable1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::RouteTable':
+        return False
+    x = r.get('VPC2PrivateRouteTable2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::RouteTable':
+        return False
+    x = r.get('VPC2PrivateSubnet1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Subnet':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S8:
+        return False
+    x = r.get('VPC2PrivateSubnet2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Subnet':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S9:
+        return False
+    x = r.get('VPC2PublicRouteTable')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::RouteTable':
+        return False
+    x = r.get('VPC2PublicSubnet1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Subnet':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S10:
+        return False
+    x = r.get('VPC2PublicSubnet2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Subnet':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S11:
+        return False
+    x = r.get('VPC2SSMEndpoint')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::VPCEndpoint':
+        return False
+    x = r.get('VPC2SSMMessagesEndpoint')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::VPCEndpoint':
+        return False
+    x = r.get('VPC2TGWSubnet1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Subnet':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S12:
+        return False
+    x = r.get('VPC2TGWSubnet2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Subnet':
+        return False
+    p = x.get('Properties')
+    if not isinstance(p, dict) or p.get('CidrBlock') != _S13:
+        return False
+    x = r.get('VPC2ToVPC1Route1')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Route':
+        return False
+    x = r.get('VPC2ToVPC1Route2')
+    if not isinstance(x, dict) or x.get('Type') != 'AWS::EC2::Route':
+        return False
+    return True
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Convert the CloudFormation template from YAML to JSON
+CFNLoader expands short-form intrinsic tags to their long form ({"Ref": ...},
+{"Fn::Sub": ...}), so the JSON copy can be deployed as-is and test-template.py
+gets the same data whichever of the two files it loads. Values JSON can't
+represent (e.g. !!binary) fail the conversion rather than being stringified.
+The SHA-256 of the converted YAML is written to a .sha256 sidecar; the JSON is
+only used while that digest matches the YAML
+"""
+
+import json
+import os
+import sys
+
+import yaml
+
+from cfn_template import CFNLoader, json_digest_path, json_sibling_path, source_digest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TEMPLATE = os.path.join(HERE, 'vpc-infrastructure.yaml')
+
+def convert(yaml_path: str) -> str:
+    """Write the JSON copy (and the digest of the YAML it came from) next to yaml_path"""
+    with open(yaml_path, 'rb') as file:
+        data = file.read()
+    template = yaml.load(data, Loader=CFNLoader)
+    json_path = json_sibling_path(yaml_path)
+    with open(json_path, 'w') as file:
+        json.dump(template, file, indent=2, ensure_ascii=False)
+        file.write('\n')
+    with open(json_digest_path(json_path), 'w') as file:
+        file.write(source_digest(data) + '\n')
+    return json_path
+
+if __name__ == "__main__":
+    for path in sys.argv[1:] or [DEFAULT_TEMPLATE]:
+        print(f"✅ Wrote {os.path.relpath(convert(path))}")